@@ -9,6 +9,7 @@ This module handles:
 """
 
 import os
+import functools
 from typing import Literal
 from pathlib import Path
 import logging
@@ -36,13 +37,13 @@ def setup_logging(level: str = "INFO") -> logging.Logger:
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         handlers=[
             logging.StreamHandler(),
-            logging.FileHandler("agent.log", mode="a"),
+            logging.FileHandler("agent.log", mode="a", delay=True),
         ],
     )
     return logging.getLogger(__name__)
 
 
-logger = setup_logging(os.getenv("LOG_LEVEL", "INFO"))
+logger = logging.getLogger(__name__)
 
 
 # ===== API Keys Configuration =====
@@ -50,6 +51,7 @@ class APIConfig:
     """Manages API keys and credentials."""
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_google_api_key() -> str:
         """Get Google Gemini API key."""
         key = os.getenv("GOOGLE_API_KEY")
@@ -62,6 +64,7 @@ class APIConfig:
         return key
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_anthropic_api_key() -> str:
         """Get Anthropic Claude API key."""
         key = os.getenv("ANTHROPIC_API_KEY")
@@ -70,6 +73,7 @@ class APIConfig:
         return key or ""
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_openai_api_key() -> str:
         """Get OpenAI API key."""
         key = os.getenv("OPENAI_API_KEY")
@@ -125,9 +129,18 @@ def get_model_config() -> dict:
     """
     Get configuration for the selected AI model.
     
+    The configuration is resolved once per process; each call returns a
+    fresh copy so callers can modify it safely.
+    
     Returns:
         Dictionary with model configuration
     """
+    return dict(_load_model_config())
+
+
+@functools.lru_cache(maxsize=None)
+def _load_model_config() -> dict:
+    """Resolve the model configuration (cached; do not modify the result)."""
     model_type = AgentConfig.MODEL_TYPE
     
     if model_type == "google":
@@ -160,6 +173,7 @@ def get_model_config() -> dict:
 
 # ===== Logging Configuration =====
 if __name__ == "__main__":
+    setup_logging(os.getenv("LOG_LEVEL", "INFO"))
     logger.info("✅ Configuration loaded successfully")
     logger.info(f"📊 Agent: {AgentConfig.AGENT_NAME}")
     logger.info(f"🧠 Model: {AgentConfig.MODEL_TYPE}")
@@ -7,7 +7,9 @@ real-world scenarios.
 
 from agents.market_researcher import MarketResearchAgent
 from tools.web_tools import ResearchTools
+from config import setup_logging
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
@@ -281,6 +283,8 @@ def show_examples_menu():
 
 def run_examples():
     """Run the examples menu."""
+    setup_logging(os.getenv("LOG_LEVEL", "INFO"))
+    
     while True:
         if not show_examples_menu():
             break
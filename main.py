@@ -12,26 +12,35 @@ Usage:
     python main.py --web              # Web interface
 """
 
+import os
 import sys
-import argparse
-import logging
-from pathlib import Path
-
-# Add project root to path
-PROJECT_ROOT = Path(__file__).parent
-sys.path.insert(0, str(PROJECT_ROOT))
+import functools
+from types import SimpleNamespace
 
 from config import setup_logging, logger, AgentConfig
-from agents.market_researcher import MarketResearchAgent
-from tools.web_tools import list_tools, get_tool_description
 
-# Configure logging
-setup_logging("INFO")
 
+# ===== Argument Fast Paths =====
+DEFAULT_ARGS = {
+    "interactive": False,
+    "research": None,
+    "web": False,
+    "tools": False,
+    "info": False,
+    "debug": False,
+}
 
-def print_welcome_banner():
-    """Print welcome message."""
-    banner = """
+# Invocations that can be resolved without building the argparse parser
+FAST_PATH_ARGS = {
+    (): {},
+    ("--tools",): {"tools": True},
+    ("-t",): {"tools": True},
+    ("--info",): {"info": True},
+}
+
+
+# ===== Static Output =====
+BANNER = """
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                                                                              ║
 ║                   🤖 MARKET RESEARCH AI AGENT                              ║
@@ -41,25 +50,133 @@ def print_welcome_banner():
 ║  and generates business intelligence reports automatically.                 ║
 ║                                                                              ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
+
+"""
+
+NEXT_STEPS = """
+======================================================================
+
+📚 NEXT STEPS:
+----------------------------------------------------------------------
+
+1. 💬 Try Interactive Mode:
+   python main.py --interactive
+
+2. 🔍 Custom Research:
+   python main.py --research "Your research query here"
+
+3. 📖 Learn More:
+   - Check the README.md for detailed documentation
+   - Review tools/web_tools.py to understand available tools
+   - Edit agents/market_researcher.py to customize behavior
+
+4. 🚀 Deploy to Cloud:
+   - Google Vertex AI
+   - Google Cloud Run
+   - AWS Lambda
+
+5. 🛠️  Extend the Agent:
+   - Add new tools in tools/web_tools.py
+   - Connect to real APIs (databases, web services)
+   - Chain multiple agents for complex workflows
+
+======================================================================
+
+"""
+
+# Pre-encoded once so the static blocks can skip the text codec
+BANNER_BYTES = BANNER.encode("utf-8")
+NEXT_STEPS_BYTES = NEXT_STEPS.encode("utf-8")
+
+
+def _write_bytes(data: bytes):
+    """
+    Write pre-encoded UTF-8 output straight to stdout's byte buffer.
+    
+    Falls back to text writes when stdout has no buffer, isn't UTF-8
+    (e.g. redirected to a StringIO, or a legacy console code page), or
+    the platform translates newlines (Windows), so line endings match
+    the surrounding print() output.
+    
+    Args:
+        data: UTF-8 encoded output
     """
-    print(banner)
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    encoding = (getattr(stream, "encoding", None) or "").lower()
+    if (
+        buffer is None
+        or encoding.replace("-", "") != "utf8"
+        or os.linesep != "\n"
+    ):
+        stream.write(data.decode("utf-8"))
+        stream.flush()
+        return
+    
+    # Flush pending text first so output stays in order
+    stream.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+# ===== Agent Instance =====
+_AGENT_SINGLETON = None
+
+
+def _get_agent():
+    """Return the process-wide agent, creating it on first use."""
+    global _AGENT_SINGLETON
+    if _AGENT_SINGLETON is None:
+        from agents.market_researcher import MarketResearchAgent
+        
+        _AGENT_SINGLETON = MarketResearchAgent()
+    return _AGENT_SINGLETON
+
+
+def _reset_agent():
+    """Discard the cached agent so the next call builds a fresh one."""
+    global _AGENT_SINGLETON
+    _AGENT_SINGLETON = None
+
+
+def print_welcome_banner():
+    """Print welcome message."""
+    _write_bytes(BANNER_BYTES)
+
+
+def format_agent_info() -> str:
+    """
+    Build the agent information block.
+    
+    Returns:
+        Agent settings and available tools as a single string
+    """
+    from tools.web_tools import AVAILABLE_TOOLS
+    
+    cfg = AgentConfig
+    lines = [
+        "",
+        "📋 AGENT INFORMATION:",
+        "=" * 70,
+        f"Name: {cfg.AGENT_NAME}",
+        f"Description: {cfg.AGENT_DESCRIPTION}",
+        f"Model: {cfg.MODEL_TYPE}",
+        f"Max Iterations: {cfg.MAX_ITERATIONS}",
+        f"Timeout: {cfg.TIMEOUT_SECONDS}s",
+        "",
+        "🛠️  AVAILABLE TOOLS:",
+        "-" * 70,
+    ]
+    for tool_name, tool_info in AVAILABLE_TOOLS.items():
+        lines.append(f"  ✓ {tool_name}")
+        lines.append(f"    {tool_info['description']}\n")
+    lines.append("=" * 70)
+    return "\n".join(lines) + "\n"
 
 
 def print_agent_info():
     """Print information about the agent."""
-    print("\n📋 AGENT INFORMATION:")
-    print("=" * 70)
-    print(f"Name: {AgentConfig.AGENT_NAME}")
-    print(f"Description: {AgentConfig.AGENT_DESCRIPTION}")
-    print(f"Model: {AgentConfig.MODEL_TYPE}")
-    print(f"Max Iterations: {AgentConfig.MAX_ITERATIONS}")
-    print(f"Timeout: {AgentConfig.TIMEOUT_SECONDS}s")
-    print("\n🛠️  AVAILABLE TOOLS:")
-    print("-" * 70)
-    for tool_name in list_tools():
-        print(f"  ✓ {tool_name}")
-        print(f"    {get_tool_description(tool_name)}\n")
-    print("=" * 70)
+    _write_bytes(format_agent_info().encode("utf-8"))
 
 
 def run_demo():
@@ -71,7 +188,7 @@ def run_demo():
     
     try:
         # Initialize agent
-        agent = MarketResearchAgent()
+        agent = _get_agent()
         
         # Run example research
         demo_query = (
@@ -104,7 +221,7 @@ def run_interactive():
     print_welcome_banner()
     
     try:
-        agent = MarketResearchAgent()
+        agent = _get_agent()
         agent.interactive_chat()
     
     except KeyboardInterrupt:
@@ -123,7 +240,7 @@ def run_custom_research(query: str):
     print("\n🔍 Running Custom Research...\n")
     
     try:
-        agent = MarketResearchAgent()
+        agent = _get_agent()
         result = agent.research(query)
         print(result)
         print_next_steps()
@@ -142,7 +259,9 @@ def run_web_interface():
     print("In production, this would launch a full web dashboard.\n")
     
     try:
-        agent = MarketResearchAgent()
+        from tools.web_tools import list_tools
+        
+        agent = _get_agent()
         
         print("📊 Example Web Functionality - Agent Status:")
         print(f"  ✓ Agent Name: {agent.name}")
@@ -160,35 +279,14 @@ def run_web_interface():
 
 def print_next_steps():
     """Print suggested next steps."""
-    print("\n" + "=" * 70)
-    print("\n📚 NEXT STEPS:")
-    print("-" * 70)
-    print("\n1. 💬 Try Interactive Mode:")
-    print("   python main.py --interactive")
-    
-    print("\n2. 🔍 Custom Research:")
-    print('   python main.py --research "Your research query here"')
-    
-    print("\n3. 📖 Learn More:")
-    print("   - Check the README.md for detailed documentation")
-    print("   - Review tools/web_tools.py to understand available tools")
-    print("   - Edit agents/market_researcher.py to customize behavior")
-    
-    print("\n4. 🚀 Deploy to Cloud:")
-    print("   - Google Vertex AI")
-    print("   - Google Cloud Run")
-    print("   - AWS Lambda")
-    
-    print("\n5. 🛠️  Extend the Agent:")
-    print("   - Add new tools in tools/web_tools.py")
-    print("   - Connect to real APIs (databases, web services)")
-    print("   - Chain multiple agents for complex workflows")
-    
-    print("\n" + "=" * 70 + "\n")
+    _write_bytes(NEXT_STEPS_BYTES)
 
 
-def main():
-    """Main entry point."""
+@functools.lru_cache(maxsize=1)
+def _get_parser():
+    """Build the command-line argument parser, once per process."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Market Research AI Agent - Google ADK Demo",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -242,25 +340,49 @@ Examples:
         "--debug",
         "-d",
         action="store_true",
-        help="Enable debug logging",
+        help="Enable debug logging (overrides LOG_LEVEL)",
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def parse_args(argv: list):
+    """
+    Parse command-line arguments.
+    
+    Bare invocation, --tools and --info are matched directly so argparse
+    is only imported for the modes that actually need it.
+    
+    Args:
+        argv: Command-line arguments, excluding the program name
+    
+    Returns:
+        Namespace with the parsed flags
+    """
+    fast_path = FAST_PATH_ARGS.get(tuple(argv))
+    if fast_path is not None:
+        return SimpleNamespace(**{**DEFAULT_ARGS, **fast_path})
+    return _get_parser().parse_args(argv)
+
+
+def main():
+    """Main entry point."""
+    args = parse_args(sys.argv[1:])
     
-    # Configure debug logging if requested
-    if args.debug:
-        setup_logging("DEBUG")
+    # Configure logging once: --debug wins, otherwise LOG_LEVEL (default INFO)
+    setup_logging("DEBUG" if args.debug else os.getenv("LOG_LEVEL", "INFO"))
     
     # Route to appropriate mode
     try:
         if args.tools:
-            print_welcome_banner()
-            print_agent_info()
+            _write_bytes(BANNER_BYTES + format_agent_info().encode("utf-8"))
         
         elif args.info:
-            print_welcome_banner()
-            print_agent_info()
-            print_next_steps()
+            _write_bytes(
+                BANNER_BYTES
+                + format_agent_info().encode("utf-8")
+                + NEXT_STEPS_BYTES
+            )
         
         elif args.interactive:
             run_interactive()
@@ -278,11 +400,6 @@ Examples:
     except KeyboardInterrupt:
         print("\n\n👋 Goodbye!")
         sys.exit(0)
-    
-    except Exception as e:
-        logger.error(f"Application error: {e}")
-        print(f"\n❌ Error: {e}")
-        sys.exit(1)
 
 
 if __name__ == "__main__":
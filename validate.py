@@ -7,14 +7,29 @@ This script checks that the project is properly configured and ready to run.
 
 import os
 import sys
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Project root, so checks don't depend on the current working directory
+BASE = Path(__file__).resolve().parent
+
 def print_header(text):
     """Print a formatted header."""
     print(f"\n{'=' * 70}")
     print(f"  {text}")
     print(f"{'=' * 70}\n")
 
+@functools.lru_cache(maxsize=None)
+def scan_dir(dir_name):
+    """List a directory once, mapping entry names to os.DirEntry objects."""
+    try:
+        with os.scandir(os.path.join(BASE, dir_name)) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        # Missing, not a directory, or unreadable: treat as empty
+        return {}
+
 def check_directory_structure():
     """Check that all required directories exist."""
     print("📁 Checking directory structure...")
@@ -27,8 +42,7 @@ def check_directory_structure():
     
     all_exist = True
     for dir_name in required_dirs:
-        path = Path(dir_name)
-        if path.exists():
+        if os.path.isdir(os.path.join(BASE, dir_name)):
             print(f"  ✅ {dir_name}/")
         else:
             print(f"  ❌ {dir_name}/ - MISSING")
@@ -58,9 +72,14 @@ def check_files():
     
     all_exist = True
     for file_name in required_files:
-        path = Path(file_name)
-        if path.exists():
-            size = path.stat().st_size
+        dir_name, _, base_name = file_name.rpartition("/")
+        entry = scan_dir(dir_name).get(base_name)
+        try:
+            size = entry.stat().st_size if entry is not None else None
+        except OSError:
+            # e.g. a dangling symlink
+            size = None
+        if size is not None:
             print(f"  ✅ {file_name} ({size} bytes)")
         else:
             print(f"  ❌ {file_name} - MISSING")
@@ -88,8 +107,8 @@ def check_env_file():
     """Check if .env file exists."""
     print("\n🔐 Checking configuration...")
     
-    env_path = Path(".env")
-    example_path = Path(".env.example")
+    env_path = BASE / ".env"
+    example_path = BASE / ".env.example"
     
     if example_path.exists():
         print(f"  ✅ .env.example exists")
@@ -116,6 +135,14 @@ def check_env_file():
         print("  ⚠️  .env file not found (create from .env.example)")
         return False
 
+def try_import(module_name):
+    """Import a module, returning the exception raised (or None on success)."""
+    try:
+        __import__(module_name)
+        return None
+    except Exception as e:
+        return e
+
 def check_imports():
     """Check that key modules can be imported."""
     print("\n📦 Checking Python imports...")
@@ -126,16 +153,19 @@ def check_imports():
         ("agents.market_researcher", "Market research agent"),
     ]
     
+    # Import concurrently to overlap disk I/O; report in the original order
+    with ThreadPoolExecutor(max_workers=len(modules_to_check)) as executor:
+        errors = list(executor.map(try_import, [name for name, _ in modules_to_check]))
+    
     all_importable = True
-    for module_name, description in modules_to_check:
-        try:
-            __import__(module_name)
+    for (module_name, description), error in zip(modules_to_check, errors):
+        if error is None:
             print(f"  ✅ {description} ({module_name})")
-        except ImportError as e:
-            print(f"  ⚠️  {description} ({module_name}) - Missing dependencies: {e}")
+        elif isinstance(error, ImportError):
+            print(f"  ⚠️  {description} ({module_name}) - Missing dependencies: {error}")
             all_importable = False
-        except Exception as e:
-            print(f"  ❌ {description} ({module_name}) - Error: {e}")
+        else:
+            print(f"  ❌ {description} ({module_name}) - Error: {error}")
             all_importable = False
     
     return all_importable